@@ -1,15 +1,10 @@
 from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html
 
 from blog.models import Category, Comment, Location, Post
 
 
-class PostInline(admin.StackedInline):
-    """Сущность Post в админке (многие ко многим)."""
-
-    model = Post
-    extra = 0
-
-
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     """Сущность Post в админке."""
@@ -27,28 +22,41 @@ class PostAdmin(admin.ModelAdmin):
         'is_published',
     )
     search_fields = ('title',)
-    list_filter = ('is_published',)
+    list_filter = ('is_published', 'category')
     list_display_links = ('title',)
+    list_per_page = 50
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        """Подгружает автора и категорию одним запросом."""
+        return super().get_queryset(request).select_related(
+            'author', 'category'
+        )
 
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     """Сущность Category в админке."""
 
-    inlines = (
-        PostInline,
-    )
     list_display = (
         'title',
         'description',
         'slug',
         'is_published',
         'created_at',
+        'posts_link',
     )
     list_editable = (
         'is_published',
     )
 
+    @admin.display(description='Публикации')
+    def posts_link(self, obj):
+        """Ссылка на список публикаций категории."""
+        url = reverse('admin:blog_post_changelist')
+        return format_html('<a href="{}?category__id__exact={}">Открыть</a>',
+                           url, obj.pk)
+
 
 @admin.register(Location)
 class LocationAdmin(admin.ModelAdmin):
@@ -73,3 +81,17 @@ class CommentAdmin(admin.ModelAdmin):
         'author',
         'post'
     )
+
+    def get_readonly_fields(self, request, obj=None):
+        """Запрещает переносить комментарий в другой пост.
+
+        Счётчик comment_count меняется только при создании
+        и удалении комментария.
+        """
+        if obj is not None:
+            return ('post',)
+        return ()
+
+    def get_queryset(self, request):
+        """Подгружает автора и пост одним запросом."""
+        return super().get_queryset(request).select_related('author', 'post')
@@ -0,0 +1,18 @@
+from django.core.cache import cache
+
+POST_LIST_CACHE_TIMEOUT = 30
+POST_LIST_CACHE_VERSION_KEY = 'posts:version'
+
+
+def get_post_list_cache_key(page_number):
+    """Ключ кэша страницы ленты для текущей версии постов."""
+    version = cache.get_or_set(POST_LIST_CACHE_VERSION_KEY, 0, None)
+    return f'posts:{version}:page:{page_number}'
+
+
+def reset_post_list_cache():
+    """Сбрасывает кэш ленты постов."""
+    try:
+        cache.incr(POST_LIST_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(POST_LIST_CACHE_VERSION_KEY, 1, None)
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-15 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_post_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at'], name='comment_post_ts_idx'),
+        ),
+    ]
@@ -76,6 +76,11 @@ class Post(BlogAbstracModel):
                                  null=True,
                                  verbose_name='Категория')
     image = models.ImageField('Фото', upload_to='post_images', blank=True)
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         """Класс метаданных."""
@@ -83,6 +88,32 @@ class Post(BlogAbstracModel):
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         default_related_name = 'posts'
+        indexes = (
+            models.Index(fields=('is_published', '-pub_date'),
+                         name='post_pub_idx'),
+            models.Index(fields=('author', '-pub_date'),
+                         name='post_author_pub_idx'),
+            models.Index(fields=('category', '-pub_date'),
+                         name='post_category_pub_idx'),
+        )
+
+    def save(self, *args, **kwargs):
+        """Сохраняет пост, не перезаписывая счётчик комментариев.
+
+        comment_count меняют только сигналы комментариев,
+        поэтому при обновлении поста он в UPDATE не попадает.
+        """
+        if (not self._state.adding and self.pk is not None
+                and not kwargs.get('force_insert')
+                and kwargs.get('update_fields') is None):
+            deferred_fields = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name != 'comment_count'
+                and field.attname not in deferred_fields
+            ]
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         """Получает абсолютную ссылку."""
@@ -107,6 +138,10 @@ class Comment(models.Model):
         """Класс метаданных."""
 
         ordering = ('created_at',)
+        indexes = (
+            models.Index(fields=('post', 'created_at'),
+                         name='comment_post_ts_idx'),
+        )
 
     def __str__(self):
         """Описание класса."""
@@ -0,0 +1,43 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from blog.caching import reset_post_list_cache
+from blog.models import Category, Comment, Location, Post, User
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    """Увеличивает счётчик комментариев поста."""
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+        reset_post_list_cache()
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    """Уменьшает счётчик комментариев поста."""
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).update(
+        comment_count=F('comment_count') - 1
+    )
+    reset_post_list_cache()
+
+
+@receiver((post_save, post_delete), sender=Post)
+@receiver((post_save, post_delete), sender=Category)
+@receiver((post_save, post_delete), sender=Location)
+def post_list_changed(sender, **kwargs):
+    """Сбрасывает кэш ленты при изменении постов и их связей."""
+    reset_post_list_cache()
+
+
+@receiver((post_save, post_delete), sender=User)
+def author_changed(sender, update_fields=None, **kwargs):
+    """Сбрасывает кэш ленты при изменении пользователя.
+
+    Обновление last_login при входе в систему кэш не сбрасывает.
+    """
+    if update_fields is None or set(update_fields) != {'last_login'}:
+        reset_post_list_cache()
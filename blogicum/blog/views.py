@@ -1,7 +1,9 @@
 from typing import Any, Dict
 
+from django.core.cache import cache
 from django.db.models.query import QuerySet, Q
-from django.db.models import Count
+from django.db.models import Prefetch
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
@@ -16,8 +18,24 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 
 from blog.models import Category, Comment, Post, User
 
+from blog.caching import POST_LIST_CACHE_TIMEOUT, get_post_list_cache_key
 from blog.forms import CommentForm, PostForm
 
+POST_CARD_FIELDS = (
+    "title",
+    "text",
+    "pub_date",
+    "image",
+    "is_published",
+    "comment_count",
+    "author__username",
+    "category__title",
+    "category__slug",
+    "category__is_published",
+    "location__name",
+    "location__is_published",
+)
+
 
 class PostMixin:
     """Класс mixin для поста."""
@@ -31,13 +49,11 @@ class CommentMixin:
 
     model = Comment
     form_class = CommentForm
+    pk_url_kwarg = "comment_pk"
 
-    def get_object(self, queryset=None):
-        """Получить объект CommentMixin."""
-        return get_object_or_404(
-            Comment, pk=self.kwargs["comment_pk"],
-            post_id=self.kwargs["post_pk"]
-        )
+    def get_queryset(self):
+        """Получить комментарии поста."""
+        return Comment.objects.filter(post_id=self.kwargs["post_pk"])
 
     def get_success_url(self):
         """Обработка переадресации.
@@ -53,12 +69,23 @@ class DispatchMixin:
     """Класс mixin для редирекции пользователя, после создания комментария."""
 
     def dispatch(self, request, *args, **kwargs):
-        """Само действие редирекции."""
-        if self.get_object().author != request.user:
+        """Само действие редирекции.
+
+        Для проверки авторства читается только author_id,
+        полный объект загружается уже после проверки.
+        """
+        pk = self.kwargs[self.pk_url_kwarg]
+        author_id = (
+            self.get_queryset().filter(pk=pk)
+            .values_list("author_id", flat=True)
+            .first()
+        )
+        if author_id is None:
+            raise Http404
+        if author_id != request.user.id:
             return redirect(
                 reverse('blog:post_detail',
-                        kwargs={'pk': self.get_object().pk}
-                        )
+                        kwargs={'pk': self.kwargs.get('post_pk', pk)})
             )
         return super().dispatch(request, *args, **kwargs)
 
@@ -73,17 +100,27 @@ class PostListView(PostMixin, ListView):
         опубликованы, старее текущей даты,
         категория опубликована.
         """
-        posts = Post.objects.prefetch_related(
+        posts = Post.objects.select_related(
             "author", "category", "location"
         ).filter(
             pub_date__lt=timezone.now(),
             is_published=True,
             category__is_published=True,
-        ).annotate(
-            comment_count=Count("comments")
-        ).order_by("-pub_date")
+        ).only(*POST_CARD_FIELDS).order_by("-pub_date")
         return posts
 
+    def paginate_queryset(self, queryset, page_size):
+        """Берёт посты текущей страницы из кэша."""
+        paginator, page, object_list, is_paginated = (
+            super().paginate_queryset(queryset, page_size)
+        )
+        page.object_list = cache.get_or_set(
+            get_post_list_cache_key(page.number),
+            lambda: list(page.object_list),
+            POST_LIST_CACHE_TIMEOUT,
+        )
+        return paginator, page, page.object_list, is_paginated
+
 
 class PostCreateView(LoginRequiredMixin, CreateView):
     """Класс отвечающий за добавление постов (форма)."""
@@ -93,7 +130,7 @@ class PostCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         """Проверяет валидность формы."""
-        form.instance.author = self.request.user
+        form.instance.author_id = self.request.user.id
         return super().form_valid(form)
 
     def get_success_url(self) -> str:
@@ -114,8 +151,13 @@ class PostDetailView(DetailView):
     def get_object(self):
         """Получить объект PostDetailView."""
         return get_object_or_404(
-            Post.objects.filter(
-                Q(is_published=True) | Q(author__username=self.request.user)
+            Post.objects.select_related(
+                "author", "category", "location"
+            ).prefetch_related(
+                Prefetch("comments",
+                         queryset=Comment.objects.select_related("author"))
+            ).filter(
+                Q(is_published=True) | Q(author_id=self.request.user.id)
             ),
             pk=self.kwargs['pk'],
         )
@@ -124,7 +166,7 @@ class PostDetailView(DetailView):
         """Получить список комментарией, связанные с постом."""
         context = super().get_context_data(**kwargs)
         context["form"] = CommentForm()
-        context["comments"] = self.object.comments.select_related("author")
+        context["comments"] = self.object.comments.all()
         return context
 
 
@@ -134,11 +176,6 @@ class PostUpdateView(LoginRequiredMixin, DispatchMixin, UpdateView):
     model = Post
     form_class = PostForm
 
-    def form_valid(self, form):
-        """Проверяет валидность формы."""
-        form.instance.author = self.request.user
-        return super().form_valid(form)
-
 
 class PostDeleteView(LoginRequiredMixin, DispatchMixin, DeleteView):
     """Класс отвечающий за удаление поста (форма)."""
@@ -158,8 +195,10 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         """Проверяет валидность формы."""
-        form.instance.author = self.request.user
-        form.instance.post = get_object_or_404(Post, pk=self.kwargs["pk"])
+        if not Post.objects.filter(pk=self.kwargs["pk"]).exists():
+            raise Http404
+        form.instance.author_id = self.request.user.id
+        form.instance.post_id = self.kwargs["pk"]
         return super().form_valid(form)
 
     def get_success_url(self):
@@ -212,15 +251,13 @@ class CategoryListView(PostMixin, ListView):
                                           slug=self.kwargs["category_slug"],
                                           is_published=True)
         return (
-            Post.objects.select_related("category")
+            Post.objects.select_related("author", "category", "location")
             .filter(category=self.category,
                     pub_date__lt=timezone.now(),
-                    category__is_published=True,
                     is_published=True,
                     )
-            .annotate(comment_count=Count("comments"))
+            .only(*POST_CARD_FIELDS)
             .order_by("-pub_date")
-            .all()
         )
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
@@ -244,7 +281,7 @@ class ProfileView(PostMixin, ListView):
             .filter(
                 author=self.author,
             )
-            .annotate(comment_count=Count("comments"))
+            .only(*POST_CARD_FIELDS)
             .order_by("-pub_date")
         )
 
@@ -277,9 +314,7 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
         return get_object_or_404(User, username=self.kwargs.get('username'))
 
     def form_valid(self, form):
-        """Проверяет валидность формы."""
-        user = form.save(commit=False)
-        user.username = form.cleaned_data.get('username')
-        self.request.user = user
-        user.save()
+        """Обновляет только изменённые поля профиля."""
+        if form.changed_data:
+            form.instance.save(update_fields=form.changed_data)
         return redirect(self.get_success_url())
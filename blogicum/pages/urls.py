@@ -1,10 +1,22 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 from pages.views import AboutPageView, RulesPageView
 
 app_name = 'pages'
 
+STATIC_PAGE_CACHE_TIMEOUT = 60 * 60
+
 urlpatterns = [
-    path('about/', AboutPageView.as_view(), name='about'),
-    path('rules/', RulesPageView.as_view(), name='rules'),
+    path('about/',
+         cache_page(STATIC_PAGE_CACHE_TIMEOUT)(
+             vary_on_cookie(AboutPageView.as_view())
+         ),
+         name='about'),
+    path('rules/',
+         cache_page(STATIC_PAGE_CACHE_TIMEOUT)(
+             vary_on_cookie(RulesPageView.as_view())
+         ),
+         name='rules'),
 ]
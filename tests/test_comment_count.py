@@ -0,0 +1,85 @@
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+
+
+def refresh_count(post):
+    post.refresh_from_db(fields=("comment_count",))
+    return post.comment_count
+
+
+@pytest.mark.django_db
+def test_comment_count_on_create_and_delete(mixer, post_with_published_location):
+    post = post_with_published_location
+    assert refresh_count(post) == 0, (
+        "Убедитесь, что у нового поста счётчик комментариев равен нулю."
+    )
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    comments[0].save()
+    assert refresh_count(post) == 3, (
+        "Убедитесь, что счётчик комментариев увеличивается только при"
+        " создании комментария."
+    )
+    comments[0].delete()
+    assert refresh_count(post) == 2, (
+        "Убедитесь, что счётчик комментариев уменьшается при удалении"
+        " комментария."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_never_negative(mixer, post_with_published_location):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post)
+    type(post).objects.filter(pk=post.pk).update(comment_count=0)
+    comment.delete()
+    assert refresh_count(post) == 0, (
+        "Убедитесь, что счётчик комментариев не уходит ниже нуля."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_on_post_cascade_delete(
+        mixer, post_with_published_location):
+    post = post_with_published_location
+    other_post = mixer.blend("blog.Post")
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    mixer.blend("blog.Comment", post=other_post)
+    post.delete()
+    assert refresh_count(other_post) == 1, (
+        "Убедитесь, что удаление поста с комментариями не меняет счётчики"
+        " других постов."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_survives_stale_post_save(
+        mixer, post_with_published_location):
+    Post = type(post_with_published_location)
+    stale_post = Post.objects.get(pk=post_with_published_location.pk)
+    mixer.blend("blog.Comment", post=stale_post)
+    stale_post.title = "edited"
+    stale_post.save()
+    assert refresh_count(stale_post) == 1, (
+        "Убедитесь, что сохранение поста не перезаписывает счётчик"
+        " комментариев."
+    )
+    assert Post.objects.get(pk=stale_post.pk).title == "edited"
+
+
+@pytest.mark.django_db
+def test_comment_count_backfill(mixer, post_with_published_location):
+    post = post_with_published_location
+    empty_post = mixer.blend("blog.Post")
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    Post = type(post)
+    Post.objects.update(comment_count=5)
+    migration = import_module("blog.migrations.0002_post_comment_count")
+    migration.fill_comment_count(apps, None)
+    assert refresh_count(post) == 2, (
+        "Убедитесь, что миграция заполняет счётчик числом комментариев поста."
+    )
+    assert refresh_count(empty_post) == 0, (
+        "Убедитесь, что миграция обнуляет счётчик у постов без комментариев."
+    )
@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+PAST = timezone.now() - datetime.timedelta(days=1)
+
+
+@pytest.fixture
+def feed_post(mixer, user, published_category):
+    return mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=True, pub_date=PAST, title="Первый пост",
+    )
+
+
+@pytest.mark.django_db
+def test_feed_shows_new_post(client, mixer, feed_post):
+    assert feed_post.title in client.get("/").content.decode()
+    mixer.blend(
+        "blog.Post", author=feed_post.author, category=feed_post.category,
+        is_published=True, pub_date=PAST, title="Второй пост",
+    )
+    assert "Второй пост" in client.get("/").content.decode(), (
+        "Убедитесь, что новый пост сразу появляется в ленте."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_shows_new_comment_count(client, mixer, feed_post):
+    assert "Комментарии (0)" in client.get("/").content.decode()
+    mixer.blend("blog.Comment", post=feed_post)
+    assert "Комментарии (1)" in client.get("/").content.decode(), (
+        "Убедитесь, что счётчик комментариев в ленте обновляется сразу."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_shows_renamed_author(client, feed_post):
+    assert f"@{feed_post.author.username}" in client.get("/").content.decode()
+    feed_post.author.username = "renamed_author"
+    feed_post.author.save()
+    assert "@renamed_author" in client.get("/").content.decode(), (
+        "Убедитесь, что новое имя автора сразу отображается в ленте."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_shows_author_renamed_in_profile(client, user_client, feed_post):
+    author = feed_post.author
+    assert f"@{author.username}" in client.get("/").content.decode()
+    response = user_client.post(
+        f"/edit_profile/{author.username}",
+        {
+            "username": "renamed_in_profile",
+            "first_name": author.first_name,
+            "last_name": author.last_name,
+            "email": "renamed@example.com",
+        },
+    )
+    assert response.status_code == 302
+    assert "@renamed_in_profile" in client.get("/").content.decode(), (
+        "Убедитесь, что после редактирования профиля новое имя автора"
+        " сразу отображается в ленте."
+    )
@@ -236,3 +236,21 @@ def get_extra_urls(
         if x.get("href") not in ignore_urls
     ]
     return diff_urls
+
+
+@pytest.mark.django_db
+def test_profile_update_normalizes_email(user_client, user):
+    user_client.post(
+        f"/edit_profile/{user.username}",
+        {
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "email": "Mixed@EXAMPLE.COM",
+        },
+    )
+    user.refresh_from_db()
+    assert user.email == "Mixed@example.com", (
+        "Убедитесь, что при редактировании профиля домен e-mail"
+        " приводится к нижнему регистру."
+    )